@@ -1,5 +1,9 @@
+from typing import (Sequence,
+                    Type)
+
 from ground.hints import (Box,
-                          Point)
+                          Point,
+                          Segment)
 
 
 def contains_point(box: Box, point: Point) -> bool:
@@ -15,3 +19,34 @@ def overlaps(left: Box, right: Box) -> bool:
 def is_subset_of(test: Box, goal: Box) -> bool:
     return (goal.min_x <= test.min_x and test.max_x <= goal.max_x
             and goal.min_y <= test.min_y and test.max_y <= goal.max_y)
+
+
+def merge(boxes: Sequence[Box], box_cls: Type[Box]) -> Box:
+    first_box = boxes[0]
+    min_x, max_x, min_y, max_y = (first_box.min_x, first_box.max_x,
+                                  first_box.min_y, first_box.max_y)
+    for box in boxes:
+        box_min_x = box.min_x
+        if box_min_x < min_x:
+            min_x = box_min_x
+        box_max_x = box.max_x
+        if box_max_x > max_x:
+            max_x = box_max_x
+        box_min_y = box.min_y
+        if box_min_y < min_y:
+            min_y = box_min_y
+        box_max_y = box.max_y
+        if box_max_y > max_y:
+            max_y = box_max_y
+    return box_cls(min_x, max_x, min_y, max_y)
+
+
+def from_segment(segment: Segment, box_cls: Type[Box]) -> Box:
+    start, end = segment.start, segment.end
+    start_x, start_y, end_x, end_y = start.x, start.y, end.x, end.y
+    return box_cls(*((start_x, end_x)
+                     if start_x < end_x
+                     else (end_x, start_x)),
+                   *((start_y, end_y)
+                     if start_y < end_y
+                     else (end_y, start_y)))
@@ -1,10 +1,11 @@
-from functools import reduce
 from math import floor
 from typing import (Callable,
                     Iterator,
-                    Optional,
+                    List,
                     Sequence,
-                    Tuple)
+                    Tuple,
+                    Type,
+                    Union)
 
 from ground.hints import (Box,
                           Point,
@@ -13,48 +14,61 @@ from reprit.base import generate_repr
 
 from . import hilbert
 from .box import (is_subset_of,
+                  merge,
                   overlaps)
 from .utils import ceil_division
 
 Item = Tuple[int, Box]
 
 
-class Node:
-    """Represents node of *R*-tree."""
-    __slots__ = 'box', 'children', 'index', 'metric'
+class InternalNode:
+    """Represents internal node of *R*-tree."""
+    __slots__ = 'box', 'children', 'index', 'sort_key'
+
+    is_leaf = False
 
     def __init__(self,
                  index: int,
                  box: Box,
-                 children: Optional[Sequence['Node']],
-                 metric: Callable[[Box, Point], Scalar]) -> None:
-        self.box, self.children, self.index, self.metric = (box, children,
-                                                            index, metric)
+                 children: Sequence['Node']) -> None:
+        self.box, self.children, self.index = box, children, index
+        # leaves are keyed by negative indices
+        # and internal nodes by non-negative ones,
+        # so keys are unique, leaves are popped before internal nodes
+        # at equal distance and nodes themselves are never compared
+        self.sort_key = index
 
     __repr__ = generate_repr(__init__)
 
-    @property
-    def is_leaf(self) -> bool:
-        return self.children is None
 
-    @property
-    def item(self) -> Item:
-        return self.index, self.box
+class LeafNode:
+    """Represents leaf node of *R*-tree."""
+    __slots__ = 'box', 'index', 'item', 'sort_key'
+
+    is_leaf = True
+
+    def __init__(self, index: int, box: Box) -> None:
+        self.box, self.index = box, index
+        self.item = index, box
+        self.sort_key = -index - 1
+
+    __repr__ = generate_repr(__init__)
+
 
-    def distance_to_point(self, point: Point) -> Scalar:
-        return self.metric(self.box, point)
+Node = Union[InternalNode, LeafNode]
+Entry = Tuple[Scalar, int, Node]
 
 
 def create_root(boxes: Sequence[Box],
                 max_children: int,
-                boxes_merger: Callable[[Box, Box], Box],
-                metric: Callable[[Box, Point], Scalar]) -> Node:
-    nodes = [Node(index, box, None, metric) for index, box in enumerate(boxes)]
-    root_box = reduce(boxes_merger, boxes)
+                box_cls: Type[Box]) -> InternalNode:
+    nodes: List[Node] = [LeafNode(index, box)
+                         for index, box in enumerate(boxes)]
+    root_box = merge(boxes, box_cls)
     leaves_count = len(nodes)
     if leaves_count <= max_children:
         # only one node, skip sorting and just fill the root box
-        return Node(len(nodes), root_box, nodes, metric)
+        return InternalNode(len(nodes), root_box, nodes)
     else:
         def node_key(node: Node,
                      double_root_delta_x: Scalar
@@ -62,16 +76,18 @@ def create_root(boxes: Sequence[Box],
                      double_root_delta_y: Scalar
                      = 2 * (root_box.max_y - root_box.min_y),
                      double_root_min_x: Scalar = 2 * root_box.min_x,
-                     double_root_min_y: Scalar = 2 * root_box.min_y) -> int:
+                     double_root_min_y: Scalar = 2 * root_box.min_y,
+                     _floor: Callable[[Scalar], int] = floor,
+                     _index: Callable[[int, int], int] = hilbert.index,
+                     _max_coordinate: int = hilbert.MAX_COORDINATE
+                     ) -> int:
             box = node.box
-            return hilbert.index(floor(hilbert.MAX_COORDINATE
-                                       * (box.min_x + box.max_x
-                                          - double_root_min_x)
-                                       / double_root_delta_x),
-                                 floor(hilbert.MAX_COORDINATE
-                                       * (box.min_y + box.max_y
-                                          - double_root_min_y)
-                                       / double_root_delta_y))
+            return _index(_floor(_max_coordinate
+                                 * (box.min_x + box.max_x - double_root_min_x)
+                                 / double_root_delta_x),
+                          _floor(_max_coordinate
+                                 * (box.min_y + box.max_y - double_root_min_y)
+                                 / double_root_delta_y))
 
         nodes = sorted(nodes,
                        key=node_key)
@@ -88,35 +104,45 @@ def create_root(boxes: Sequence[Box],
             while start < level_limit:
                 stop = min(start + max_children, level_limit)
                 children = nodes[start:stop]
-                nodes.append(Node(len(nodes),
-                                  reduce(boxes_merger,
-                                         [child.box for child in children]),
-                                  children, metric))
+                parent = InternalNode(len(nodes),
+                                      merge([child.box for child in children],
+                                            box_cls),
+                                      children)
+                nodes.append(parent)
                 start = stop
-        return nodes[-1]
+        # the last parent built is the one on the top level
+        return parent
 
 
 def find_node_box_subsets_items(node: Node, box: Box) -> Iterator[Item]:
     if is_subset_of(node.box, box):
         for leaf in node_to_leaves(node):
             yield leaf.item
-    elif not node.is_leaf and overlaps(box, node.box):
+    elif isinstance(node, InternalNode) and overlaps(box, node.box):
         for child in node.children:
             yield from find_node_box_subsets_items(child, box)
 
 
 def find_node_box_supersets_items(node: Node, box: Box) -> Iterator[Item]:
     if is_subset_of(box, node.box):
-        if node.is_leaf:
+        if isinstance(node, LeafNode):
             yield node.item
         else:
             for child in node.children:
                 yield from find_node_box_supersets_items(child, box)
 
 
-def node_to_leaves(node: Node) -> Iterator[Node]:
-    if node.is_leaf:
+def node_to_leaves(node: Node) -> Iterator[LeafNode]:
+    if isinstance(node, LeafNode):
         yield node
     else:
         for child in node.children:
             yield from node_to_leaves(child)
+
+
+def to_children_entries(node: InternalNode,
+                        point: Point,
+                        metric: Callable[[Box, Point], Scalar]
+                        ) -> List[Entry]:
+    return [(metric(child.box, point), child.sort_key, child)
+            for child in node.children]
@@ -1,92 +1,77 @@
-from functools import reduce
 from math import (floor,
                   inf)
 from typing import (Callable,
-                    Optional,
+                    List,
                     Sequence,
-                    Tuple)
+                    Tuple,
+                    Type,
+                    TypeVar,
+                    Union,
+                    cast)
 
 from ground.hints import (Box,
-                          Point,
                           Scalar,
                           Segment)
 from reprit.base import generate_repr
 
 from . import hilbert
+from .box import (from_segment,
+                  merge)
 from .utils import ceil_division
 
 Item = Tuple[int, Segment]
 
 
-class Node:
-    """Represents node of segmental *R*-tree."""
-    __slots__ = ('box', 'box_point_metric', 'box_segment_metric',
-                 'children', 'index', 'segment', 'segment_point_metric',
-                 'segments_metric')
+class InternalNode:
+    """Represents internal node of segmental *R*-tree."""
+    __slots__ = 'box', 'children', 'index', 'sort_key'
+
+    is_leaf = False
 
     def __init__(self,
                  index: int,
                  box: Box,
-                 segment: Optional[Segment],
-                 children: Optional[Sequence['Node']],
-                 box_point_metric: Callable[[Box, Point], Scalar],
-                 box_segment_metric: Callable[[Box, Segment], Scalar],
-                 segment_point_metric: Callable[[Segment, Point], Scalar],
-                 segments_metric: Callable[[Segment, Segment], Scalar]
-                 ) -> None:
-        self.box, self.children, self.index, self.segment = (
-            box, children, index, segment
-        )
-        (self.box_point_metric, self.box_segment_metric,
-         self.segment_point_metric, self.segments_metric) = (
-            box_point_metric, box_segment_metric, segment_point_metric,
-            segments_metric
-        )
+                 children: Sequence['Node']) -> None:
+        self.box, self.children, self.index = box, children, index
+        # internal nodes are keyed by negative indices
+        # and leaves by non-negative ones,
+        # so keys are unique and nodes themselves are never compared
+        self.sort_key = -index - 1
 
     __repr__ = generate_repr(__init__)
 
-    @property
-    def is_leaf(self) -> bool:
-        return self.children is None
 
-    @property
-    def item(self) -> Item:
-        return self.index, self.segment
+class LeafNode:
+    """Represents leaf node of segmental *R*-tree."""
+    __slots__ = 'box', 'index', 'item', 'segment', 'sort_key'
+
+    is_leaf = True
+
+    def __init__(self, index: int, box: Box, segment: Segment) -> None:
+        self.box, self.index, self.segment = box, index, segment
+        self.item = index, segment
+        self.sort_key = index
+
+    __repr__ = generate_repr(__init__)
 
-    def distance_to_point(self,
-                          point: Point,
-                          *,
-                          _minus_inf: Scalar = -inf) -> Scalar:
-        return (self.segment_point_metric(self.segment, point) or _minus_inf
-                if self.is_leaf
-                else self.box_point_metric(self.box, point))
 
-    def distance_to_segment(self,
-                            segment: Segment,
-                            *,
-                            _minus_inf: Scalar = -inf) -> Scalar:
-        return (self.segments_metric(self.segment, segment) or _minus_inf
-                if self.is_leaf
-                else self.box_segment_metric(self.box, segment))
+Node = Union[InternalNode, LeafNode]
+Entry = Tuple[Scalar, int, Node]
+_Target = TypeVar('_Target')
 
 
 def create_root(segments: Sequence[Segment],
-                boxes: Sequence[Box],
                 max_children: int,
-                boxes_merger: Callable[[Box, Box], Box],
-                box_point_metric: Callable[[Box, Point], Scalar],
-                box_segment_metric: Callable[[Box, Segment], Scalar],
-                segment_point_metric: Callable[[Segment, Point], Scalar],
-                segments_metric: Callable[[Segment, Segment], Scalar]) -> Node:
-    nodes = [Node(index, box, segment, None, box_point_metric,
-                  box_segment_metric, segment_point_metric, segments_metric)
-             for index, (box, segment) in enumerate(zip(boxes, segments))]
-    root_box = reduce(boxes_merger, boxes)
+                box_cls: Type[Box]) -> InternalNode:
+    nodes: List[Node] = [
+        LeafNode(index, from_segment(segment, box_cls), segment)
+        for index, segment in enumerate(segments)
+    ]
+    root_box = merge([node.box for node in nodes], box_cls)
     leaves_count = len(nodes)
     if leaves_count <= max_children:
         # only one node, skip sorting and just fill the root box
-        return Node(len(nodes), root_box, None, nodes, box_point_metric,
-                    box_segment_metric, segment_point_metric, segments_metric)
+        return InternalNode(len(nodes), root_box, nodes)
     else:
         def node_key(node: Node,
                      double_root_delta_x: Scalar
@@ -94,17 +79,18 @@ def create_root(segments: Sequence[Segment],
                      double_root_delta_y: Scalar
                      = 2 * (root_box.max_y - root_box.min_y) or 1,
                      double_root_min_x: Scalar = 2 * root_box.min_x,
-                     double_root_min_y: Scalar = 2 * root_box.min_y
+                     double_root_min_y: Scalar = 2 * root_box.min_y,
+                     _floor: Callable[[Scalar], int] = floor,
+                     _index: Callable[[int, int], int] = hilbert.index,
+                     _max_coordinate: int = hilbert.MAX_COORDINATE
                      ) -> int:
             box = node.box
-            return hilbert.index(floor(hilbert.MAX_COORDINATE
-                                       * (box.min_x + box.max_x
-                                          - double_root_min_x)
-                                       / double_root_delta_x),
-                                 floor(hilbert.MAX_COORDINATE
-                                       * (box.min_y + box.max_y
-                                          - double_root_min_y)
-                                       / double_root_delta_y))
+            return _index(_floor(_max_coordinate
+                                 * (box.min_x + box.max_x - double_root_min_x)
+                                 / double_root_delta_x),
+                          _floor(_max_coordinate
+                                 * (box.min_y + box.max_y - double_root_min_y)
+                                 / double_root_delta_y))
 
         nodes = sorted(nodes,
                        key=node_key)
@@ -121,11 +107,29 @@ def create_root(segments: Sequence[Segment],
             while start < level_limit:
                 stop = min(start + max_children, level_limit)
                 children = nodes[start:stop]
-                nodes.append(Node(len(nodes),
-                                  reduce(boxes_merger,
-                                         [child.box for child in children]),
-                                  None, children, box_point_metric,
-                                  box_segment_metric, segment_point_metric,
-                                  segments_metric))
+                parent = InternalNode(len(nodes),
+                                      merge([child.box for child in children],
+                                            box_cls),
+                                      children)
+                nodes.append(parent)
                 start = stop
-        return nodes[-1]
+        # the last parent built is the one on the top level
+        return parent
+
+
+def to_children_entries(node: InternalNode,
+                        target: _Target,
+                        box_metric: Callable[[Box, _Target], Scalar],
+                        segment_metric: Callable[[Segment, _Target], Scalar],
+                        *,
+                        _minus_inf: float = -inf) -> List[Entry]:
+    children = node.children
+    if isinstance(children[0], LeafNode):
+        # leaves touching the target get the least possible distance,
+        # so they are popped before internal nodes at zero distance
+        return [(segment_metric(child.segment, target) or _minus_inf,
+                 child.sort_key, child)
+                for child in cast(Sequence[LeafNode], children)]
+    else:
+        return [(box_metric(child.box, target), child.sort_key, child)
+                for child in children]
@@ -1,5 +1,7 @@
-from heapq import (heappop as _heappop,
-                   heappush as _heappush)
+from heapq import (heapify as _heapify,
+                   heappop as _heappop,
+                   heappush as _heappush,
+                   heapreplace as _heapreplace)
 from typing import (Iterator as _Iterator,
                     List as _List,
                     Optional as _Optional,
@@ -14,9 +16,11 @@ from reprit.base import generate_repr as _generate_repr
 from .core import box as _box
 from .core.r import (
     Item as _Item,
+    LeafNode as _LeafNode,
     create_root as _create_root,
     find_node_box_subsets_items as _find_node_box_subsets_items,
-    find_node_box_supersets_items as _find_node_box_supersets_items)
+    find_node_box_supersets_items as _find_node_box_supersets_items,
+    to_children_entries as _to_children_entries)
 
 
 class Tree:
@@ -47,8 +51,7 @@ class Tree:
             context = _get_context()
         self._boxes, self._context, self._max_children, self._root = (
             boxes, context, max_children,
-            _create_root(boxes, max_children, context.merged_box,
-                         context.box_point_squared_distance))
+            _create_root(boxes, max_children, context.box_cls))
 
     __repr__ = _generate_repr(__init__)
 
@@ -498,28 +501,34 @@ class Tree:
         >>> tree.nearest_item(Point(10, 10)) == (9, Box(-10, 10, 0, 10))
         True
         """
-        queue = [(0, 0, self._root)]
-        while queue:
-            _, _, node = _heappop(queue)
-            for child in node.children:
-                _heappush(queue,
-                          (child.distance_to_point(point),
-                           -child.index - 1 if child.is_leaf else child.index,
-                           child))
-            if queue and queue[0][1] < 0:
-                _, _, node = _heappop(queue)
+        metric = self._context.box_point_squared_distance
+        push, replace, to_entries = (_heappush, _heapreplace,
+                                     _to_children_entries)
+        queue = to_entries(self._root, point, metric)
+        _heapify(queue)
+        while True:
+            _, _, node = queue[0]
+            if isinstance(node, _LeafNode):
                 return node.item
+            entries = to_entries(node, point, metric)
+            replace(queue, entries[0])
+            for entry in entries[1:]:
+                push(queue, entry)
 
     def _n_nearest_items(self, n: int, point: _Point) -> _Iterator[_Item]:
-        queue = [(0, 0, self._root)]
+        metric = self._context.box_point_squared_distance
+        pop, push, replace, to_entries = (_heappop, _heappush, _heapreplace,
+                                          _to_children_entries)
+        queue = to_entries(self._root, point, metric)
+        _heapify(queue)
         while n and queue:
-            _, _, node = _heappop(queue)
-            for child in node.children:
-                _heappush(queue,
-                          (child.distance_to_point(point),
-                           -child.index - 1 if child.is_leaf else child.index,
-                           child))
-            while n and queue and queue[0][1] < 0:
-                _, _, node = _heappop(queue)
+            _, _, node = queue[0]
+            if isinstance(node, _LeafNode):
+                pop(queue)
                 yield node.item
                 n -= 1
+            else:
+                entries = to_entries(node, point, metric)
+                replace(queue, entries[0])
+                for entry in entries[1:]:
+                    push(queue, entry)
@@ -1,5 +1,7 @@
-from heapq import (heappop as _heappop,
-                   heappush as _heappush)
+from heapq import (heapify as _heapify,
+                   heappop as _heappop,
+                   heappush as _heappush,
+                   heapreplace as _heapreplace)
 from typing import (Iterator as _Iterator,
                     Optional as _Optional,
                     Sequence as _Sequence)
@@ -11,7 +13,9 @@ from ground.hints import (Point as _Point,
 from reprit.base import generate_repr as _generate_repr
 
 from .core.segmental import (Item as _Item,
-                             create_root as _create_root)
+                             LeafNode as _LeafNode,
+                             create_root as _create_root,
+                             to_children_entries as _to_children_entries)
 
 
 class Tree:
@@ -21,7 +25,7 @@ class Tree:
     Reference:
         https://en.wikipedia.org/wiki/Hilbert_R-tree#Packed_Hilbert_R-trees
     """
-    __slots__ = '_context', '_max_children', '_root', '_segments'
+    __slots__ = '_context', '_max_children', '_root', '_segments', '_size'
 
     def __init__(self,
                  segments: _Sequence[_Segment],
@@ -40,23 +44,10 @@ class Tree:
         """
         if context is None:
             context = _get_context()
-        box_cls = context.box_cls
         self._context, self._max_children, self._root, self._segments = (
             context, max_children,
-            _create_root(segments,
-                         [box_cls(*((segment.start.x, segment.end.x)
-                                    if segment.start.x < segment.end.x
-                                    else (segment.end.x, segment.start.x)),
-                                  *((segment.start.y, segment.end.y)
-                                    if segment.start.y < segment.end.y
-                                    else (segment.end.y, segment.start.y)))
-                          for segment in segments], max_children,
-                         context.merged_box,
-                         context.box_point_squared_distance,
-                         context.box_segment_squared_distance,
-                         context.segment_point_squared_distance,
-                         context.segments_squared_distance),
-            segments)
+            _create_root(segments, max_children, context.box_cls), segments)
+        self._size = len(segments)
 
     __repr__ = _generate_repr(__init__)
 
@@ -132,7 +123,8 @@ class Tree:
         :param n: positive upper bound for number of result indices.
         :param segment: input segment.
         :returns:
-            indices of segments in the tree the nearest to the input segment.
+            indices of segments in the tree the nearest to the input segment,
+            ordered by distance if ``n < size``, by index otherwise.
 
         >>> from ground.base import get_context
         >>> context = get_context()
@@ -148,8 +140,8 @@ class Tree:
         True
         """
         return ([index for index, _ in self._n_nearest_items(n, segment)]
-                if n < len(self._segments)
-                else range(len(self._segments)))
+                if n < self._size
+                else range(self._size))
 
     def n_nearest_items(self, n: int, segment: _Segment) -> _Sequence[_Item]:
         """
@@ -170,7 +162,9 @@ class Tree:
             positive upper bound for number of result indices with segments.
         :param segment: input segment.
         :returns:
-            indices with segments in the tree the nearest to the input segment.
+            indices with segments in the tree
+            the nearest to the input segment,
+            ordered by distance if ``n < size``, by index otherwise.
 
         >>> from ground.base import get_context
         >>> context = get_context()
@@ -187,7 +181,7 @@ class Tree:
         True
         """
         return list(self._n_nearest_items(n, segment)
-                    if n < len(self._segments)
+                    if n < self._size
                     else enumerate(self._segments))
 
     def n_nearest_segments(self, n: int, segment: _Segment
@@ -207,7 +201,9 @@ class Tree:
 
         :param n: positive upper bound for number of result segments.
         :param segment: input segment.
-        :returns: segments in the tree the nearest to the input segment.
+        :returns:
+            segments in the tree the nearest to the input segment,
+            ordered by distance if ``n < size``, by index otherwise.
 
         >>> from ground.base import get_context
         >>> context = get_context()
@@ -224,7 +220,7 @@ class Tree:
         True
         """
         return ([segment for _, segment in self._n_nearest_items(n, segment)]
-                if n < len(self._segments)
+                if n < self._size
                 else self._segments)
 
     def n_nearest_to_point_indices(self, n: int, point: _Point
@@ -246,7 +242,8 @@ class Tree:
         :param n: positive upper bound for number of result indices.
         :param point: input point.
         :returns:
-            indices of segments in the tree the nearest to the input point.
+            indices of segments in the tree the nearest to the input point,
+            ordered by distance if ``n < size``, by index otherwise.
 
         >>> from ground.base import get_context
         >>> context = get_context()
@@ -262,8 +259,8 @@ class Tree:
         """
         return ([index
                  for index, _ in self._n_nearest_to_point_items(n, point)]
-                if n < len(self._segments)
-                else range(len(self._segments)))
+                if n < self._size
+                else range(self._size))
 
     def n_nearest_to_point_items(self, n: int, point: _Point
                                  ) -> _Sequence[_Item]:
@@ -285,7 +282,8 @@ class Tree:
             positive upper bound for number of result indices with segments.
         :param point: input point.
         :returns:
-            indices with segments in the tree the nearest to the input point.
+            indices with segments in the tree the nearest to the input point,
+            ordered by distance if ``n < size``, by index otherwise.
 
         >>> from ground.base import get_context
         >>> context = get_context()
@@ -302,7 +300,7 @@ class Tree:
         True
         """
         return list(self._n_nearest_to_point_items(n, point)
-                    if n < len(self._segments)
+                    if n < self._size
                     else enumerate(self._segments))
 
     def n_nearest_to_point_segments(self, n: int, point: _Point
@@ -322,7 +320,9 @@ class Tree:
 
         :param n: positive upper bound for number of result segments.
         :param point: input point.
-        :returns: segments in the tree the nearest to the input point.
+        :returns:
+            segments in the tree the nearest to the input point,
+            ordered by distance if ``n < size``, by index otherwise.
 
         >>> from ground.base import get_context
         >>> context = get_context()
@@ -339,7 +339,7 @@ class Tree:
         """
         return ([segment
                  for _, segment in self._n_nearest_to_point_items(n, point)]
-                if n < len(self._segments)
+                if n < self._size
                 else self._segments)
 
     def nearest_index(self, segment: _Segment) -> int:
@@ -398,17 +398,21 @@ class Tree:
         ...  == (0, Segment(Point(0, 1), Point(1, 1))))
         True
         """
-        queue = [(0, 0, self._root)]
-        while queue:
-            _, _, node = _heappop(queue)
-            for child in node.children:
-                _heappush(queue,
-                          (child.distance_to_segment(segment),
-                           child.index if child.is_leaf else -child.index - 1,
-                           child))
-            if queue and queue[0][1] >= 0:
-                _, _, node = _heappop(queue)
+        context = self._context
+        box_metric = context.box_segment_squared_distance
+        segment_metric = context.segments_squared_distance
+        push, replace, to_entries = (_heappush, _heapreplace,
+                                     _to_children_entries)
+        queue = to_entries(self._root, segment, box_metric, segment_metric)
+        _heapify(queue)
+        while True:
+            _, _, node = queue[0]
+            if isinstance(node, _LeafNode):
                 return node.item
+            entries = to_entries(node, segment, box_metric, segment_metric)
+            replace(queue, entries[0])
+            for entry in entries[1:]:
+                push(queue, entry)
 
     def nearest_segment(self, segment: _Segment) -> _Segment:
         """
@@ -493,17 +497,21 @@ class Tree:
         ...  == (0, Segment(Point(0, 1), Point(1, 1))))
         True
         """
-        queue = [(0, 0, self._root)]
-        while queue:
-            _, _, node = _heappop(queue)
-            for child in node.children:
-                _heappush(queue,
-                          (child.distance_to_point(point),
-                           child.index if child.is_leaf else -child.index - 1,
-                           child))
-            if queue and queue[0][1] >= 0:
-                _, _, node = _heappop(queue)
+        context = self._context
+        box_metric = context.box_point_squared_distance
+        segment_metric = context.segment_point_squared_distance
+        push, replace, to_entries = (_heappush, _heapreplace,
+                                     _to_children_entries)
+        queue = to_entries(self._root, point, box_metric, segment_metric)
+        _heapify(queue)
+        while True:
+            _, _, node = queue[0]
+            if isinstance(node, _LeafNode):
                 return node.item
+            entries = to_entries(node, point, box_metric, segment_metric)
+            replace(queue, entries[0])
+            for entry in entries[1:]:
+                push(queue, entry)
 
     def nearest_to_point_segment(self, point: _Point) -> _Segment:
         """
@@ -534,30 +542,42 @@ class Tree:
         return result
 
     def _n_nearest_items(self, n: int, segment: _Segment) -> _Iterator[_Item]:
-        queue = [(0, 0, self._root)]
+        context = self._context
+        box_metric = context.box_segment_squared_distance
+        segment_metric = context.segments_squared_distance
+        pop, push, replace, to_entries = (_heappop, _heappush, _heapreplace,
+                                          _to_children_entries)
+        queue = to_entries(self._root, segment, box_metric, segment_metric)
+        _heapify(queue)
         while n and queue:
-            _, _, node = _heappop(queue)
-            for child in node.children:
-                _heappush(queue,
-                          (child.distance_to_segment(segment),
-                           child.index if child.is_leaf else -child.index - 1,
-                           child))
-            while n and queue and queue[0][1] >= 0:
-                _, _, node = _heappop(queue)
+            _, _, node = queue[0]
+            if isinstance(node, _LeafNode):
+                pop(queue)
                 yield node.item
                 n -= 1
+            else:
+                entries = to_entries(node, segment, box_metric, segment_metric)
+                replace(queue, entries[0])
+                for entry in entries[1:]:
+                    push(queue, entry)
 
     def _n_nearest_to_point_items(self, n: int, point: _Point
                                   ) -> _Iterator[_Item]:
-        queue = [(0, 0, self._root)]
+        context = self._context
+        box_metric = context.box_point_squared_distance
+        segment_metric = context.segment_point_squared_distance
+        pop, push, replace, to_entries = (_heappop, _heappush, _heapreplace,
+                                          _to_children_entries)
+        queue = to_entries(self._root, point, box_metric, segment_metric)
+        _heapify(queue)
         while n and queue:
-            _, _, node = _heappop(queue)
-            for child in node.children:
-                _heappush(queue,
-                          (child.distance_to_point(point),
-                           child.index if child.is_leaf else -child.index - 1,
-                           child))
-            while n and queue and queue[0][1] >= 0:
-                _, _, node = _heappop(queue)
+            _, _, node = queue[0]
+            if isinstance(node, _LeafNode):
+                pop(queue)
                 yield node.item
                 n -= 1
+            else:
+                entries = to_entries(node, point, box_metric, segment_metric)
+                replace(queue, entries[0])
+                for entry in entries[1:]:
+                    push(queue, entry)
@@ -13,8 +13,7 @@ from tests.strategies import (points_strategies,
                               to_boxes,
                               to_points)
 from tests.utils import (Point,
-                         Strategy,
-                         identity)
+                         Strategy)
 
 non_empty_points_lists = points_strategies.flatmap(partial(strategies.lists,
                                                            min_size=1))
@@ -69,9 +68,7 @@ def scalars_to_trees_with_balls(scalars: Strategy[Scalar],
                              points, scalars.map(abs))
 
 
-trees_with_balls = (strategies.builds(scalars_to_trees_with_balls,
-                                      scalars_strategies)
-                    .flatmap(identity))
+trees_with_balls = scalars_strategies.flatmap(scalars_to_trees_with_balls)
 
 
 def scalars_to_trees_with_boxes(scalars: Strategy[Scalar],
@@ -94,6 +91,4 @@ def scalars_to_trees(scalars: Strategy[Scalar],
                            max_size=max_tree_size)
 
 
-trees_with_boxes = (strategies.builds(scalars_to_trees_with_boxes,
-                                      scalars_strategies)
-                    .flatmap(identity))
+trees_with_boxes = scalars_strategies.flatmap(scalars_to_trees_with_boxes)
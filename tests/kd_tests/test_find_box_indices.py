@@ -24,9 +24,11 @@ def test_properties(tree_with_box: Tuple[Tree, Box]) -> None:
 
     result = tree.find_box_indices(box)
 
-    indices = range(len(tree.points))
+    points = tree.points
+    indices = range(len(points))
     assert all(index in indices for index in result)
-    assert all(contains_point(box, tree.points[index]) for index in result)
-    assert all(index in result
+    assert all(contains_point(box, points[index]) for index in result)
+    result_set = set(result)
+    assert all(index in result_set
                for index in indices
-               if contains_point(box, tree.points[index]))
+               if contains_point(box, points[index]))
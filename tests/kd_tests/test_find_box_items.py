@@ -29,6 +29,7 @@ def test_properties(tree_with_box: Tuple[Tree, Box]) -> None:
     assert all(item in items for item in result)
     assert all(contains_point(box, point)
                for _, point in result)
-    assert all(item in result
+    result_set = set(result)
+    assert all(item in result_set
                for item in items
                if contains_point(box, item[1]))
@@ -27,6 +27,7 @@ def test_properties(tree_with_box: Tuple[Tree, Box]) -> None:
 
     assert all(point in tree.points for point in result)
     assert all(contains_point(box, point) for point in result)
-    assert all(point in result
+    result_set = set(result)
+    assert all(point in result_set
                for point in tree.points
                if contains_point(box, point))
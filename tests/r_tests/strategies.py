@@ -7,18 +7,15 @@ from ground.hints import (Box,
                           Scalar)
 from hypothesis import strategies
 
-from locus.core.hilbert import MAX_COORDINATE
 from locus.r import Tree
-from tests.strategies import (scalars_strategies,
+from tests.strategies import (max_children_counts,
+                              scalars_strategies,
                               to_boxes,
                               to_points)
 from tests.utils import (Point,
                          Strategy)
 
 MIN_BOXES_SIZE = 2
-max_children_counts = (strategies.sampled_from([2 ** power
-                                                for power in range(1, 10)])
-                       | strategies.integers(2, MAX_COORDINATE))
 boxes_strategies = scalars_strategies.map(to_boxes)
 boxes_lists = (boxes_strategies
                .flatmap(partial(strategies.lists,
@@ -8,17 +8,14 @@ from ground.hints import (Point,
                           Segment)
 from hypothesis import strategies
 
-from locus.core.hilbert import MAX_COORDINATE
 from locus.segmental import Tree
-from tests.strategies import (scalars_strategies,
+from tests.strategies import (max_children_counts,
+                              scalars_strategies,
                               to_points,
                               to_segments)
 from tests.utils import Strategy
 
 MIN_SEGMENTS_SIZE = 2
-max_children_counts = (strategies.sampled_from([2 ** power
-                                                for power in range(1, 10)])
-                       | strategies.integers(2, MAX_COORDINATE))
 segments_strategies = scalars_strategies.map(to_segments)
 segments_lists = (segments_strategies
                   .flatmap(partial(strategies.lists,
@@ -1,4 +1,5 @@
-from .base import (points_strategies,
+from .base import (max_children_counts,
+                   points_strategies,
                    scalars_strategies,
                    to_boxes,
                    to_points,
@@ -1,12 +1,14 @@
 import sys
 from decimal import Decimal
 from fractions import Fraction
-from functools import partial
+from functools import (lru_cache,
+                       partial)
 from operator import add
 
 from ground.hints import Scalar
 from hypothesis import strategies
 
+from locus.core.hilbert import MAX_COORDINATE
 from tests.utils import (Box,
                          Point,
                          Segment,
@@ -64,6 +66,9 @@ scalars_strategies_factories = {
 scalars_strategies = strategies.sampled_from(
         [factory(MIN_SCALAR, MAX_SCALAR)
          for factory in scalars_strategies_factories.values()])
+max_children_counts = (strategies.sampled_from([2 ** power
+                                                for power in range(1, 10)])
+                       | strategies.integers(2, MAX_COORDINATE))
 
 
 def to_points(scalars: Strategy[Scalar]) -> Strategy[Point]:
@@ -73,6 +78,7 @@ def to_points(scalars: Strategy[Scalar]) -> Strategy[Point]:
 points_strategies = scalars_strategies.map(to_points)
 
 
+@lru_cache(None)
 def to_segments(scalar: Strategy[Scalar]) -> Strategy[Segment]:
     return (strategies.lists(to_points(scalar),
                              min_size=2,
@@ -81,6 +87,7 @@ def to_segments(scalar: Strategy[Scalar]) -> Strategy[Segment]:
             .map(pack(Segment)))
 
 
+@lru_cache(None)
 def to_boxes(scalars: Strategy[Scalar]) -> Strategy[Box]:
     return (to_pairs(strategies.lists(scalars,
                                       min_size=2,
@@ -179,10 +179,6 @@ def all_unique(iterable: Iterable[_T1]) -> bool:
     return True
 
 
-def identity(value: _T1) -> _T1:
-    return value
-
-
 def to_hilbert_index_complete(size: int, x: int, y: int) -> int:
     result = 0
     step = size // 2